@@ -1,17 +1,100 @@
-import os
+import asyncio
+import gzip
+import inspect
 import json
-import requests
-from datetime import datetime, timedelta, date
+import math
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, date
+from functools import lru_cache, partial, wraps
+from textual import work
+from textual.worker import get_current_worker
 from textual.app import App, ComposeResult
 from textual.screen import ModalScreen
 from textual.containers import Horizontal, Vertical
-from textual.widgets import Footer, Header, DataTable
+from textual.coordinate import Coordinate
+from textual.widgets import Footer, Header, DataTable, LoadingIndicator
 from textual.events import Resize
+from textual.message import Message
 from textual.widgets import Static
 
-CACHE_FILE = "f1_cache.json"
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # Optional speedup; fall back to stdlib json
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+try:
+    import zstandard
+except ImportError:  # Optional; cache blobs fall back to gzip
+    zstandard = None
+
+
+CACHE_DB = "f1_cache.sqlite"
+# Pre-SQLite cache file; imported once into an empty database
+LEGACY_CACHE_FILE = "f1_cache.json"
 API_BASE = "http://api.jolpi.ca"
 
+# Cache TTLs (minutes): short while a race is running, long between race weekends
+DEFAULT_TTL = 1440
+RACE_WINDOW_TTL = 5
+RACE_WINDOW_BEFORE = timedelta(hours=1)
+RACE_WINDOW_AFTER = timedelta(hours=4)
+RACE_WEEKEND_TTL = 30
+# Per-round results: settled results are effectively immutable, fresh ones still move
+PAST_RESULTS_TTL = 60 * 24 * 30
+RECENT_RESULTS_TTL = 15
+RESULTS_TTL = 60
+# The API caps limit at 100 result rows (~5 races), so season results are paged
+SEASON_RESULTS_PAGE = 100
+# Most result rows one round can add; bounds how many pages a season can span
+SEASON_MAX_GRID = 26
+# Reopening a detail screen within this window skips the cache/API round-trip
+HISTORY_TTL_SECONDS = 60
+# (column index, width) pairs for the detail tables' short numeric columns
+_DRIVER_COL_WIDTHS = ((0, 4), (2, 4), (3, 6), (5, 4))
+_CONSTRUCTOR_COL_WIDTHS = ((0, 4), (2, 6), (4, 6), (5, 4))
+
+# Seconds to wait for a resize drag to settle before re-laying out tables
+RESIZE_DEBOUNCE = 0.1
+# Seconds the standings cursor must rest on a row before its details are prefetched
+PREFETCH_DEBOUNCE = 0.3
+
+# Memoized result of get_current_year(), refreshed hourly
+_YEAR_CACHE = {"year": None, "stamp": 0.0}
+
+# (schedule payload, parsed race windows) last computed by _race_windows()
+_RACE_WINDOWS = {"entry": (None, ())}
+
+# Shared pool for independent API fetches (standings pair, per-round results)
+_POOL = ThreadPoolExecutor(max_workers=8)
+
+# Shared session so repeated calls to the API reuse pooled keep-alive connections.
+# Created lazily by _session() so a fully cached run never imports requests.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Shared cache connection; all access is serialized since fetches run on worker threads
+_DB = None
+_DB_LOCK = threading.Lock()
+
+# Network fetches currently running, keyed by cache key, so duplicates can wait on them
+_INFLIGHT: dict = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+# Decoded entries already read or written this session, keyed by cache key
+_CACHE_MEM: dict = {}
+# SQLite data_version the memo was last validated against
+_CACHE_VERSION = None
+
 # Minimal, elegant banner for TabF1
 ASCII_ART = (
     "┌─────── TabF1 ──────┐\n"
@@ -20,42 +103,250 @@ ASCII_ART = (
 )
 
 
-def get_cache():
-    """Load cache JSON safely; return empty dict on any issue."""
+def _db():
+    """Return the shared cache connection, creating the schema on first use."""
+    global _DB
+    if _DB is None:
+        conn = sqlite3.connect(CACHE_DB, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, time REAL, ttl INTEGER, "
+            "etag TEXT, last_modified TEXT, data BLOB)"
+        )
+        _import_legacy_cache(conn)
+        _DB = conn
+    return _DB
+
+
+def _import_legacy_cache(conn):
+    """Seed an empty database from the old JSON cache file, if present."""
+    if conn.execute("SELECT 1 FROM cache LIMIT 1").fetchone():
+        return
     try:
-        if not os.path.exists(CACHE_FILE):
-            return {}
-        if os.path.getsize(CACHE_FILE) == 0:
-            return {}
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f) or {}
+        with open(LEGACY_CACHE_FILE, "r") as f:
+            legacy = json.load(f) or {}
     except Exception:
-        # Corrupt or unreadable cache; ignore and start fresh
-        return {}
+        # Missing or corrupt legacy cache; nothing to import
+        return
+    for key, entry in legacy.items():
+        if isinstance(entry, dict) and "data" in entry:
+            _write_entry(conn, key, entry)
+
+
+def _encode_data(data):
+    """Serialize a payload for storage; low compression levels keep CPU cost negligible."""
+    raw = _json_dumps(data)
+    if zstandard is not None:
+        # Compressor objects aren't thread-safe, so use one per call
+        return zstandard.ZstdCompressor(level=3).compress(raw)
+    return gzip.compress(raw, compresslevel=3)
+
+
+def _decode_data(blob):
+    # The codec is identified by its magic bytes; rows written before
+    # compression was added hold plain JSON
+    if blob[:4] == b"\x28\xb5\x2f\xfd":
+        if zstandard is None:
+            raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+        blob = zstandard.ZstdDecompressor().decompress(blob)
+    elif blob[:2] == b"\x1f\x8b":
+        blob = gzip.decompress(blob)
+    return _json_loads(blob)
+
+
+def _write_entry(conn, key, entry):
+    conn.execute(
+        "INSERT OR REPLACE INTO cache (key, time, ttl, etag, last_modified, data) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            key,
+            entry.get("time"),
+            entry.get("ttl"),
+            entry.get("etag"),
+            entry.get("last_modified"),
+            _encode_data(entry["data"]),
+        ),
+    )
+
+
+def _sync_mem_cache(conn):
+    """Drop memoized entries if another process has committed to the database.
+
+    PRAGMA data_version only changes for commits made by other connections,
+    so our own writes (which update the memo directly) don't invalidate it.
+    """
+    global _CACHE_VERSION
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if version != _CACHE_VERSION:
+        _CACHE_MEM.clear()
+        _CACHE_VERSION = version
 
 
-def set_cache(data):
-    """Write cache atomically to avoid partial files."""
+def _entry_time(value):
+    """Stored fetch time as epoch seconds; legacy ISO strings count as expired."""
     try:
-        tmp_path = f"{CACHE_FILE}.tmp"
-        with open(tmp_path, "w") as f:
-            json.dump(data, f)
-        os.replace(tmp_path, CACHE_FILE)
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _cache_get(key):
+    """Return the cache entry dict for key, or None if missing/unreadable."""
+    try:
+        with _DB_LOCK:
+            conn = _db()
+            _sync_mem_cache(conn)
+            entry = _CACHE_MEM.get(key)
+            if entry is not None:
+                return entry
+            row = conn.execute(
+                "SELECT time, ttl, etag, last_modified, data FROM cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        time_, ttl, etag, last_modified, data = row
+        entry = {
+            "time": _entry_time(time_),
+            "ttl": ttl,
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": _decode_data(data),
+        }
     except Exception:
+        # Corrupt or unreadable cache; treat as a miss
+        return None
+    # A _cache_put may have landed while we decoded; keep the newer entry
+    with _DB_LOCK:
+        return _CACHE_MEM.setdefault(key, entry)
+
+
+def _cache_put(key, entry):
+    """Store a single cache entry."""
+    try:
+        with _DB_LOCK:
+            # Updated under the lock so a concurrent _cache_get can't overwrite it
+            _CACHE_MEM[key] = entry
+            _write_entry(_db(), key, entry)
+    except (sqlite3.Error, OSError):
         # Best-effort; ignore write errors to avoid crashing UI
         pass
 
 
-def fetch_with_cache(endpoint, key, expire_minutes=1440, force=False):
-    cache = get_cache()
-    now = datetime.utcnow().isoformat()
-    if not force and key in cache:
+def _session():
+    """Return the shared HTTP session, importing requests on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            # Retry transient gateway errors; the final response still goes
+            # through raise_for_status so failures surface as before. read=0
+            # keeps a hung API at one 8s timeout instead of three. Retry-After is
+            # ignored: urllib3 would otherwise sleep up to 6h on a throttled 503,
+            # stalling every single-flight waiter on that key.
+            retry = Retry(total=2, read=0, backoff_factor=0.3,
+                          status_forcelist=[502, 503, 504], raise_on_status=False,
+                          respect_retry_after_header=False)
+            # pool_maxsize covers the concurrent fetches issued from _POOL
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+def _path(d, *keys, default=None):
+    """Walk nested dicts by keys, returning default if any step is missing."""
+    cur = d
+    for k in keys:
+        cur = cur.get(k) if isinstance(cur, dict) else None
+        if cur is None:
+            return default
+    return cur
+
+
+def _race_start(race):
+    """Return the race start as an aware UTC datetime, or None if unknown."""
+    race_date = race.get("date")
+    if not race_date:
+        return None
+    race_time = (race.get("time") or "12:00:00Z").rstrip("Z")
+    try:
+        return datetime.fromisoformat(f"{race_date}T{race_time}").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+
+
+def _race_windows(schedule):
+    """Return (window start, window end, weekend start, weekend end) per race.
+
+    Parsed once per schedule payload; the cache memo hands back the same
+    object on every warm hit, so identity is enough to detect a new one.
+    """
+    cached_schedule, windows = _RACE_WINDOWS["entry"]
+    if cached_schedule is schedule:
+        return windows
+    parsed = []
+    for race in _path(schedule, "MRData", "RaceTable", "Races", default=[]):
+        start = _race_start(race)
+        if not start:
+            continue
+        day = start.date()
+        # Friday to Monday of a race weekend: practice/quali/penalties shift data
+        parsed.append((
+            start - RACE_WINDOW_BEFORE,
+            start + RACE_WINDOW_AFTER,
+            day - timedelta(days=2),
+            day + timedelta(days=1),
+        ))
+    windows = tuple(parsed)
+    _RACE_WINDOWS["entry"] = (schedule, windows)
+    return windows
+
+
+def _ttl_for(key):
+    """Pick a cache TTL in minutes based on where we are in the race calendar."""
+    if key.startswith("race_schedule_"):
+        return DEFAULT_TTL
+    # Only consult a schedule that is already cached; fetching it here would put a
+    # blocking request in front of every cold fetch. The standings load warms it.
+    schedule = _path(_cache_get(f"race_schedule_{get_current_year()}"), "data")
+    if not schedule:
+        return DEFAULT_TTL
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    ttl = DEFAULT_TTL
+    for window_start, window_end, weekend_start, weekend_end in _race_windows(schedule):
+        if window_start <= now <= window_end:
+            return RACE_WINDOW_TTL
+        if weekend_start <= today <= weekend_end:
+            ttl = RACE_WEEKEND_TTL
+    return ttl
+
+
+def fetch_with_cache(endpoint, key, expire_minutes=None, force=False):
+    """Fetch an API endpoint through the local cache.
+
+    When expire_minutes is None the TTL is chosen by _ttl_for(); the TTL in
+    force is stored with the entry so later lookups honour it.
+    """
+    # Interned keys make the memo/in-flight dict lookups pointer comparisons
+    key = sys.intern(key)
+    if expire_minutes is None:
+        expire_minutes = _ttl_for(key)
+    cached = _cache_get(key) or {}
+    now = time.time()
+    if not force and "data" in cached:
         try:
-            cached = cache[key]
             data0 = cached.get("data")
             # Calendar-aware caching: for season schedule, skip expiration on non-race days
             if key.startswith("race_schedule_"):
-                races = data0.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+                races = _path(data0, "MRData", "RaceTable", "Races", default=[])
                 today_iso = date.today().isoformat()
                 # If today is not one of the scheduled race dates, return cached without refreshing
                 if not any(r.get("date") == today_iso for r in races if r.get("date")):
@@ -66,36 +357,79 @@ def fetch_with_cache(endpoint, key, expire_minutes=1440, force=False):
                 parts = key.split("_")
                 if len(parts) >= 3:
                     season = parts[2]
-                    sched_key = f"race_schedule_{season}"
-                    sched = cache.get(sched_key, {}).get("data", {}).get("MRData", {}).get("RaceTable", {}).get("Races", [])
+                    sched_entry = _cache_get(f"race_schedule_{season}") or {}
+                    sched = _path(sched_entry, "data", "MRData", "RaceTable", "Races", default=[])
                     today_iso = date.today().isoformat()
                     # If today is not a scheduled race date, return cached results
                     if sched and today_iso not in [r.get("date") for r in sched if r.get("date")]:
                         return data0
-            # Standard expiration check
-            cached_time = datetime.fromisoformat(cached.get("time", now))
-            if (datetime.fromisoformat(now) - cached_time) < timedelta(minutes=expire_minutes):
+            # Standard expiration check; never trust an entry longer than the current policy
+            ttl = min(cached.get("ttl") or expire_minutes, expire_minutes)
+            if now - cached["time"] < ttl * 60:
                 return data0
-        except Exception:
+        except (ValueError, TypeError, KeyError):
             # Treat invalid timestamps/data as expired or bypassed
             pass
+    # Single-flight: identical concurrent misses share one request and one cache write
+    with _INFLIGHT_LOCK:
+        pending = _INFLIGHT.get(key)
+        if pending is None:
+            future = _INFLIGHT[key] = Future()
+    if pending is not None:
+        return pending.result()
+    try:
+        data = _fetch_and_store(endpoint, key, cached, now, expire_minutes)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(data)
+        return data
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _fetch_and_store(endpoint, key, cached, now, expire_minutes):
+    """GET endpoint (revalidating cached, if any) and write the result to the cache."""
+    # Revalidate with the stored validators so unchanged payloads come back as 304
+    headers = {}
+    if "data" in cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
     url = f"{API_BASE}{endpoint}"
-    resp = requests.get(url, timeout=8)
-    resp.raise_for_status()
-    data = resp.json()
-    cache[key] = {"time": now, "data": data}
-    set_cache(cache)
-    return data
+    resp = _session().get(url, headers=headers, timeout=8)
+    if resp.status_code == 304 and "data" in cached:
+        entry = dict(cached, time=now, ttl=expire_minutes)
+    else:
+        resp.raise_for_status()
+        entry = {
+            "time": now,
+            "ttl": expire_minutes,
+            # Parse the raw bytes; skips requests' text decoding and charset sniffing
+            "data": _json_loads(resp.content),
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+    _cache_put(key, entry)
+    return entry["data"]
 
 
 def get_current_year():
-    return datetime.now().year
+    # Re-read the clock at most hourly; the year only matters at the boundary
+    now = time.time()
+    if now - _YEAR_CACHE["stamp"] > 3600:
+        _YEAR_CACHE["year"] = datetime.now().year
+        _YEAR_CACHE["stamp"] = now
+    return _YEAR_CACHE["year"]
 
 
 def get_driver_standings(force=False):
     year = get_current_year()
     data = fetch_with_cache(f"/ergast/f1/{year}/driverstandings.json", f"drivers_{year}", force=force)
-    lists = data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
+    lists = _path(data, "MRData", "StandingsTable", "StandingsLists", default=[])
     if lists and "DriverStandings" in lists[0]:
         return lists[0]["DriverStandings"]
     return []
@@ -104,17 +438,28 @@ def get_driver_standings(force=False):
 def get_constructor_standings(force=False):
     year = get_current_year()
     data = fetch_with_cache(f"/ergast/f1/{year}/constructorstandings.json", f"constructors_{year}", force=force)
-    lists = data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
+    lists = _path(data, "MRData", "StandingsTable", "StandingsLists", default=[])
     if lists and "ConstructorStandings" in lists[0]:
         return lists[0]["ConstructorStandings"]
     return []
 
 
+def get_race_schedule(season, force=False):
+    """Get the season's race calendar."""
+    data = fetch_with_cache(
+        f"/ergast/f1/{season}.json?limit=100",
+        f"race_schedule_{season}",
+        expire_minutes=DEFAULT_TTL,
+        force=force
+    )
+    return _path(data, "MRData", "RaceTable", "Races", default=[])
+
+
 def get_latest_race(force=False):
     """Get the latest race information."""
     year = get_current_year()
     data = fetch_with_cache(f"/ergast/f1/{year}/last/results.json", f"latest_race_{year}", force=force)
-    races = data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+    races = _path(data, "MRData", "RaceTable", "Races", default=[])
     if races:
         return races[0]
     return {}
@@ -127,7 +472,7 @@ def get_race_results(season, round_no, force=False):
         f"race_results_{season}_{round_no}", 
         force=force
     )
-    races = data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+    races = _path(data, "MRData", "RaceTable", "Races", default=[])
     if races and "Results" in races[0]:
         return races[0]["Results"]
     return []
@@ -141,10 +486,51 @@ def get_season_driver_standings_progression(season, force=False):
         expire_minutes=1440,
         force=force
     )
-    standings_lists = data.get("MRData", {}).get("StandingsTable", {}).get("StandingsLists", [])
+    standings_lists = _path(data, "MRData", "StandingsTable", "StandingsLists", default=[])
     return standings_lists
 
 
+@lru_cache(maxsize=2048)
+def _truncate(text, width):
+    # Names and teams repeat across every re-render, so memoize the slicing
+    if width <= 0:
+        return ""
+    return text if len(text) <= width else f"{text[:width - 1]}…"
+
+
+def _full_name(driver):
+    """Join an Ergast Driver's given and family names."""
+    return " ".join((driver.get("givenName", ""), driver.get("familyName", ""))).strip()
+
+
+def _sync_rows(table, rows, last_rows) -> None:
+    """Bring table in line with rows, touching only the cells that changed."""
+    if len(rows) != len(last_rows):
+        table.clear()
+        table.add_rows(rows)
+        return
+    for i, (new, old) in enumerate(zip(rows, last_rows)):
+        if new == old:
+            continue
+        for j, (value, previous) in enumerate(zip(new, old)):
+            if value != previous:
+                table.update_cell_at(Coordinate(i, j), value, update_width=True)
+
+
+def _resize_columns(table, widths, rows) -> None:
+    """Rebuild table's columns at fixed widths, then re-add rows, keeping the cursor row.
+
+    DataTable only takes a column width in add_column(), so new widths mean new columns.
+    """
+    labels = [column.label for column in table.ordered_columns]
+    cursor_row = table.cursor_row
+    table.clear(columns=True)
+    for label, width in zip(labels, widths):
+        table.add_column(label, width=width)
+    table.add_rows(rows)
+    table.move_cursor(row=cursor_row)
+
+
 class StandingsPanel(Vertical):
     def __init__(self, panel_id, title):
         super().__init__(id=panel_id)
@@ -156,6 +542,10 @@ class StandingsPanel(Vertical):
         self.table = table
         yield table
 
+    def on_resize(self, event: Resize) -> None:  # type: ignore[override]
+        # Panels are sized by the layout pass after the app's Resize; re-fit from here too
+        self.app.schedule_resize_columns()
+
 
 class RacePanel(Vertical):
     def __init__(self, panel_id, title):
@@ -186,6 +576,28 @@ class F1DashboardApp(App):
         super().__init__()
         self._drivers_data = []
         self._constructors_data = []
+        # Untruncated display tuples built once per data load, reused across resizes
+        self._drivers_rows = []
+        self._constructors_rows = []
+        # Panel width budgets the columns were last sized for
+        self._last_widths = (None, None)
+        # (driver_w, team_w, name_w) the rows were last truncated to
+        self._col_widths = None
+        # Column widths the tables were last built with
+        self._table_widths = None
+        self._resize_timer = None
+        self._prefetch_timer = None
+        # Truncated cell tuples currently shown, used to diff on re-render
+        self._last_driver_rows = []
+        self._last_constructor_rows = []
+        # The _drivers_rows/_constructors_rows lists those cells were built from
+        self._rendered_rows = (None, None)
+        # Widget references cached in on_mount; they live as long as the app
+        self._main = None
+        self._d_panel = None
+        self._c_panel = None
+        self._dtab = None
+        self._ctab = None
 
     def compose(self) -> ComposeResult:
         # Title and season header (compact)
@@ -206,38 +618,55 @@ class F1DashboardApp(App):
 
     def on_mount(self) -> None:
         year = get_current_year()
-        d_panel = self.query_one("#drivers-panel", StandingsPanel)
-        c_panel = self.query_one("#constructors-panel", StandingsPanel)
+        self._main = self.query_one("#main", Horizontal)
+        d_panel = self._d_panel = self.query_one("#drivers-panel", StandingsPanel)
+        c_panel = self._c_panel = self.query_one("#constructors-panel", StandingsPanel)
         d_panel.styles.border_title = f"Drivers — {year}"
         c_panel.styles.border_title = f"Constructors — {year}"
-        dtab = d_panel.table
-        ctab = c_panel.table
+        dtab = self._dtab = d_panel.table
+        ctab = self._ctab = c_panel.table
         assert dtab and ctab
         dtab.cursor_type = "row"
         ctab.cursor_type = "row"
         dtab.add_columns("Pos", "Driver", "Team", "Pts", "Wins")
         ctab.add_columns("Pos", "Constructor", "Pts", "Wins")
-        # Start loading data immediately without blocking UI
+        # Start loading data in a background worker so the UI stays responsive
         self.load_data()
         # Also schedule a post-refresh sizing to handle first render.
         self.call_after_refresh(self.render_tables)
 
     def on_resize(self, event: Resize) -> None:  # type: ignore[override]
-        try:
-            main = self.query_one("#main", Horizontal)
-            main.styles.layout = "vertical" if self.size.width < 110 else "horizontal"
-        except Exception:
-            pass
-        self.render_tables()
+        # Resize can arrive before on_mount has built the panels
+        if self._main is None:
+            return
+        self._main.styles.layout = "vertical" if event.size.width < 110 else "horizontal"
+        self.schedule_resize_columns()
+
+    def schedule_resize_columns(self) -> None:
+        """Re-fit the table columns once resizing settles."""
+        if self._d_panel is None:
+            return
+        # Coalesce resize storms into a single layout pass once dragging settles
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(RESIZE_DEBOUNCE, self._on_resize_settled)
+
+    def _on_resize_settled(self) -> None:
+        self._resize_timer = None
+        # Cells are truncated to the column widths, so only re-add rows if those moved
+        if self._apply_column_widths():
+            self._rebuild_rows()
 
     def action_refresh(self) -> None:
+        get_driver_last_results.cache_clear()
+        get_constructor_last_results.cache_clear()
         self.load_data(force=True)
 
     def action_focus_left(self) -> None:
-        self.query_one("#drivers-panel DataTable", DataTable).focus()
+        self._dtab.focus()
 
     def action_focus_right(self) -> None:
-        self.query_one("#constructors-panel DataTable", DataTable).focus()
+        self._ctab.focus()
 
     def action_open_race_screen(self) -> None:
         """Open the dedicated race screen."""
@@ -245,10 +674,9 @@ class F1DashboardApp(App):
 
     def action_open_details(self) -> None:
         """Open a modal with details for the selected row in the focused table."""
-        try:
-            dtab = self.query_one("#drivers-panel DataTable", DataTable)
-            ctab = self.query_one("#constructors-panel DataTable", DataTable)
-        except Exception:
+        dtab = self._dtab
+        ctab = self._ctab
+        if dtab is None or ctab is None:
             return
 
         if dtab.has_focus:
@@ -270,61 +698,126 @@ class F1DashboardApp(App):
         except Exception:
             pass
 
-    def on_data_table_row_selected(self, event) -> None:
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Open details when a row is selected (mouse or Enter inside table)."""
         # Only handle events from main app tables, not modal screens
-        try:
-            table = event.sender  # type: ignore[attr-defined]
-            if isinstance(table, DataTable):
-                # Check if we're in the main app (not a modal screen)
-                if hasattr(self, '_drivers_data') and hasattr(self, '_constructors_data'):
-                    if table.id and table.id.startswith("drivers-panel"):
-                        self.action_open_details()
-                    elif table.id and table.id.startswith("constructors-panel"):
-                        self.action_open_details()
-        except Exception:
-            # Ignore errors to prevent recursion
-            pass
+        if event.data_table is self._dtab or event.data_table is self._ctab:
+            self.action_open_details()
+
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Warm the detail-screen cache for the highlighted row while the user reads."""
+        table = event.data_table
+        idx = event.cursor_row
+        target = None
+        if table is self._dtab and 0 <= idx < len(self._drivers_data):
+            driver_id = self._drivers_data[idx].get("Driver", {}).get("driverId", "")
+            if driver_id:
+                target = (get_driver_last_results, driver_id)
+        elif table is self._ctab and 0 <= idx < len(self._constructors_data):
+            const_id = self._constructors_data[idx].get("Constructor", {}).get("constructorId", "")
+            if const_id:
+                target = (get_constructor_last_results, const_id)
+        # A running thread can't be stopped, so only prefetch once the cursor settles
+        if self._prefetch_timer is not None:
+            self._prefetch_timer.stop()
+            self._prefetch_timer = None
+        if target is not None:
+            self._prefetch_timer = self.set_timer(
+                PREFETCH_DEBOUNCE, lambda: self._on_prefetch_settled(*target)
+            )
+
+    def _on_prefetch_settled(self, fetch, item_id) -> None:
+        self._prefetch_timer = None
+        self._prefetch_details(fetch, item_id)
 
-    @staticmethod
-    def _truncate(text, width):
-        if width <= 0:
-            return ""
-        if len(text) <= width:
-            return text
-        return text[: max(0, width - 1)] + "…"
+    @work(thread=True, exclusive=True, group="prefetch", exit_on_error=False)
+    def _prefetch_details(self, fetch, item_id) -> None:
+        # Superseded before it started; skip the request entirely
+        if get_current_worker().is_cancelled:
+            return
+        # Best-effort: failures resurface when the detail screen itself loads.
+        # Same arguments as the detail screens so they hit this TTL cache entry.
+        fetch(item_id, limit=10, order="desc")
 
     def load_data(self, force=False) -> None:
-        # Fetch data synchronously with short timeout; small datasets
-        d_panel = self.query_one("#drivers-panel", StandingsPanel)
-        c_panel = self.query_one("#constructors-panel", StandingsPanel)
-        d_panel.styles.border_subtitle = "Loading…"
-        c_panel.styles.border_subtitle = "Loading…"
+        self._d_panel.styles.border_subtitle = "Loading…"
+        self._c_panel.styles.border_subtitle = "Loading…"
         self.refresh()
+        self._fetch_worker(force)
+
+    @work(exclusive=True, thread=True)
+    def _fetch_worker(self, force=False) -> None:
+        """Fetch both standings concurrently off the UI thread."""
         try:
-            self._drivers_data = get_driver_standings(force=force)
-            self._constructors_data = get_constructor_standings(force=force)
-            d_panel.styles.border_subtitle = f"Total {len(self._drivers_data)} drivers"
-            c_panel.styles.border_subtitle = f"Total {len(self._constructors_data)} constructors"
+            # Warm the calendar alongside so later fetches can pick race-aware TTLs
+            _POOL.submit(get_race_schedule, get_current_year())
+            drivers = _POOL.submit(get_driver_standings, force)
+            constructors = _POOL.submit(get_constructor_standings, force)
+            result = (drivers.result(), constructors.result())
         except Exception as e:
-            msg = f"Error: {e}"
-            d_panel.styles.border_subtitle = msg
-            c_panel.styles.border_subtitle = msg
-        finally:
-            # Defer render to the next refresh so sizes are accurate.
-            self.call_after_refresh(self.render_tables)
-            self.refresh()
+            self.call_from_thread(self._apply_error, e)
+            return
+        self.call_from_thread(self._apply_data, *result)
+
+    def _apply_data(self, drivers, constructors) -> None:
+        self._drivers_data = drivers
+        self._constructors_data = constructors
+        self._drivers_rows = [
+            (
+                str(d.get("position")),
+                _full_name(d.get("Driver") or {}),
+                d["Constructors"][0].get("name", "") if d.get("Constructors") else "",
+                str(d.get("points")),
+                str(d.get("wins")),
+            )
+            for d in drivers
+        ]
+        self._constructors_rows = [
+            (
+                str(c.get("position")),
+                c.get("Constructor", {}).get("name", ""),
+                str(c.get("points")),
+                str(c.get("wins")),
+            )
+            for c in constructors
+        ]
+        self._d_panel.styles.border_subtitle = f"Total {len(self._drivers_data)} drivers"
+        self._c_panel.styles.border_subtitle = f"Total {len(self._constructors_data)} constructors"
+        # Defer render to the next refresh so sizes are accurate.
+        self.call_after_refresh(self.render_tables)
+        self.refresh()
+
+    def _apply_error(self, error) -> None:
+        msg = f"Error: {error}"
+        self._d_panel.styles.border_subtitle = msg
+        self._c_panel.styles.border_subtitle = msg
+        self.call_after_refresh(self.render_tables)
+        self.refresh()
 
     def render_tables(self) -> None:
-        d_panel = self.query_one("#drivers-panel", StandingsPanel)
-        c_panel = self.query_one("#constructors-panel", StandingsPanel)
-        dtab = d_panel.table
-        ctab = c_panel.table
-        assert dtab and ctab
+        # Before layout the panels have no size; the settled resize will render
+        if not self._d_panel.size.width or not self._c_panel.size.width:
+            return
+        widths_changed = self._apply_column_widths()
+        drivers_shown, constructors_shown = self._rendered_rows
+        # Same widths and the same data load means the tables are already current
+        if (not widths_changed and drivers_shown is self._drivers_rows
+                and constructors_shown is self._constructors_rows):
+            return
+        self._rebuild_rows()
+
+    def _apply_column_widths(self) -> bool:
+        """Work out column widths for the current panels; return True if they changed."""
+        d_panel = self._d_panel
+        c_panel = self._c_panel
 
         # Width budgets based on current panel sizes
         d_width = max(40, d_panel.size.width - 4)
         c_width = max(30, c_panel.size.width - 4)
+        # Vertical-only or jitter resizes leave the budgets alone; nothing to redo
+        if (d_width, c_width) == self._last_widths:
+            return False
+        self._last_widths = (d_width, c_width)
 
         # Drivers table columns: Pos(3), Pts(5), Wins(4) are fixed; Driver/Team share remainder
         fixed_d = 3 + 5 + 4
@@ -337,50 +830,39 @@ class F1DashboardApp(App):
         fixed_c = 3 + 5 + 4
         name_w = max(10, c_width - fixed_c)
 
-        try:
-            # Drivers table: [0]=Pos, [1]=Driver, [2]=Team, [3]=Pts, [4]=Wins
-            dtab.set_column_width(0, 3)
-            dtab.set_column_width(1, driver_w)
-            dtab.set_column_width(2, team_w)
-            dtab.set_column_width(3, 5)
-            dtab.set_column_width(4, 4)
-
-            # Constructors table: [0]=Pos, [1]=Constructor, [2]=Pts, [3]=Wins
-            ctab.set_column_width(0, 3)
-            ctab.set_column_width(1, name_w)
-            ctab.set_column_width(2, 5)
-            ctab.set_column_width(3, 4)
-        except Exception:
-            pass
-
-        # Populate data
-        dtab.clear()
-        for d in self._drivers_data:
-            pos = str(d.get("position"))
-            name = f"{d.get('Driver', {}).get('givenName', '')} {d.get('Driver', {}).get('familyName', '')}".strip()
-            team = d.get("Constructors", [{}])[0].get("name", "") if d.get("Constructors") else ""
-            pts = str(d.get("points"))
-            wins = str(d.get("wins"))
-            dtab.add_row(
-                self._truncate(pos, 3),
-                self._truncate(name, driver_w),
-                self._truncate(team, team_w),
-                self._truncate(pts, 5),
-                self._truncate(wins, 4),
-            )
-
-        ctab.clear()
-        for c in self._constructors_data:
-            pos = str(c.get("position"))
-            name = c.get("Constructor", {}).get("name", "")
-            pts = str(c.get("points"))
-            wins = str(c.get("wins"))
-            ctab.add_row(
-                self._truncate(pos, 3),
-                self._truncate(name, name_w),
-                self._truncate(pts, 5),
-                self._truncate(wins, 4),
-            )
+        widths = (driver_w, team_w, name_w)
+        changed = widths != self._col_widths
+        self._col_widths = widths
+        return changed
+
+    def _rebuild_rows(self) -> None:
+        """Repopulate both tables from the loaded data at the current widths."""
+        dtab = self._dtab
+        ctab = self._ctab
+        assert dtab and ctab and self._col_widths
+        driver_w, team_w, name_w = self._col_widths
+
+        # Pos/Pts/Wins are a few characters at most and always fit their columns,
+        # so only the name/team columns need truncating.
+        driver_rows = [
+            (pos, _truncate(name, driver_w), _truncate(team, team_w), pts, wins)
+            for pos, name, team, pts, wins in self._drivers_rows
+        ]
+        constructor_rows = [
+            (pos, _truncate(name, name_w), pts, wins)
+            for pos, name, pts, wins in self._constructors_rows
+        ]
+
+        if self._table_widths != self._col_widths:
+            _resize_columns(dtab, (3, driver_w, team_w, 5, 4), driver_rows)
+            _resize_columns(ctab, (3, name_w, 5, 4), constructor_rows)
+            self._table_widths = self._col_widths
+        else:
+            _sync_rows(dtab, driver_rows, self._last_driver_rows)
+            _sync_rows(ctab, constructor_rows, self._last_constructor_rows)
+        self._last_driver_rows = driver_rows
+        self._last_constructor_rows = constructor_rows
+        self._rendered_rows = (self._drivers_rows, self._constructors_rows)
 
 
 # ----- Details helpers & screens -----
@@ -398,6 +880,13 @@ class RaceScreen(ModalScreen[None]):
     def __init__(self):
         super().__init__()
         self._all_races = []
+        self._resize_timer = None
+        # What is currently on screen, so unchanged renders can be skipped
+        self._rendered = (None, None)
+        self._last_race_rows = []
+        # Widget refs, cached in on_mount
+        self._r_panel = None
+        self._rtab = None
 
     def compose(self) -> ComposeResult:
         yield Static("┌─────── F1 Race Results ──────┐\n│     All Races This Season    │\n└──────────────────────────────┘", id="title")
@@ -407,21 +896,34 @@ class RaceScreen(ModalScreen[None]):
 
     def on_mount(self) -> None:
         year = get_current_year()
-        r_panel = self.query_one("#race-panel", RacePanel)
+        r_panel = self._r_panel = self.query_one("#race-panel", RacePanel)
         r_panel.styles.border_title = f"All Races — {year}"
-        rtab = r_panel.table
+        rtab = self._rtab = r_panel.table
         assert rtab
         rtab.cursor_type = "row"
         rtab.add_columns("Grand Prix (Country)", "Date", "Winner", "Team", "Laps", "Race Time")
         self.load_race_data()
         self.call_after_refresh(self.render_race_table)
 
+    def on_resize(self, event: Resize) -> None:  # type: ignore[override]
+        # Resize can arrive before on_mount has built the panel
+        if self._r_panel is None:
+            return
+        # Same trailing-edge debounce as the main dashboard
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(RESIZE_DEBOUNCE, self._on_resize_settled)
+
+    def _on_resize_settled(self) -> None:
+        self._resize_timer = None
+        self.render_race_table()
+
     def action_refresh(self) -> None:
         self.load_race_data(force=True)
 
     def action_open_race_details(self) -> None:
         """Open detailed race results for selected race."""
-        rtab = self.query_one("#race-panel", RacePanel).table
+        rtab = self._rtab
         if rtab and rtab.cursor_row is not None:
             race_idx = rtab.cursor_row
             if 0 <= race_idx < len(self._all_races):
@@ -444,35 +946,42 @@ class RaceScreen(ModalScreen[None]):
                     message = f"🏁 {race_name}\n\nRace scheduled for {date}\nResults not available yet"
                     self.app.push_screen(MessageScreen(message))
 
-    def on_data_table_row_selected(self, event) -> None:
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Open race details when a row is selected in the race table."""
-        # Only handle events from race tables in this screen
-        try:
-            table = event.sender  # type: ignore[attr-defined]
-            if isinstance(table, DataTable) and table.id and table.id.startswith("race-panel"):
-                self.action_open_race_details()
-                event.prevent_default()  # Prevent event bubbling
-        except Exception:
-            # Ignore errors to prevent issues
-            pass
+        if event.data_table is self._rtab:
+            self.action_open_race_details()
+            event.stop()  # Keep it from bubbling to the app
 
     def load_race_data(self, force=False) -> None:
-        r_panel = self.query_one("#race-panel", RacePanel)
-        r_panel.styles.border_subtitle = "Loading…"
+        self._r_panel.styles.border_subtitle = "Loading…"
         self.refresh()
+        self._race_worker(force)
+
+    @work(exclusive=True, thread=True)
+    def _race_worker(self, force=False) -> None:
+        """Load the season's races and results off the UI thread."""
+        year = get_current_year()
         try:
-            year = get_current_year()
-            self._all_races = get_all_races_season(year, force=force)
-            r_panel.styles.border_subtitle = f"{len(self._all_races)} races in {year}"
+            races = get_all_races_season(year, force=force)
         except Exception as e:
-            r_panel.styles.border_subtitle = f"Error: {e}"
-        finally:
-            self.call_after_refresh(self.render_race_table)
-            self.refresh()
+            self.app.call_from_thread(self._apply_race_error, e)
+            return
+        self.app.call_from_thread(self._apply_race_data, year, races)
+
+    def _apply_race_data(self, year, races) -> None:
+        self._all_races = races
+        self._r_panel.styles.border_subtitle = f"{len(races)} races in {year}"
+        self.call_after_refresh(self.render_race_table)
+        self.refresh()
+
+    def _apply_race_error(self, error) -> None:
+        self._r_panel.styles.border_subtitle = f"Error: {error}"
+        self.call_after_refresh(self.render_race_table)
+        self.refresh()
 
     def render_race_table(self) -> None:
-        r_panel = self.query_one("#race-panel", RacePanel)
-        rtab = r_panel.table
+        r_panel = self._r_panel
+        rtab = self._rtab
         assert rtab
 
         # Width budget based on panel size
@@ -485,19 +994,15 @@ class RaceScreen(ModalScreen[None]):
         winner_w = max(18, int(flex_r * 0.35))
         team_w = max(15, flex_r - gp_w - winner_w)
 
-        try:
-            # Race table: [0]=Grand Prix, [1]=Date, [2]=Winner, [3]=Team, [4]=Laps, [5]=Race Time
-            rtab.set_column_width(0, gp_w)
-            rtab.set_column_width(1, 12)
-            rtab.set_column_width(2, winner_w)
-            rtab.set_column_width(3, team_w)
-            rtab.set_column_width(4, 5)
-            rtab.set_column_width(5, 12)
-        except Exception:
-            pass
+        # Same race list at the same widths renders identically; nothing to do
+        widths = (gp_w, winner_w, team_w)
+        races_shown, widths_shown = self._rendered
+        if races_shown is self._all_races and widths == widths_shown:
+            return
+        self._rendered = (self._all_races, widths)
 
-        # Populate race table with all season races
-        rtab.clear()
+        # Build the rows for all season races, then apply only what changed
+        race_rows = []
         for race in self._all_races:
             # Grand Prix name and country
             race_name = race.get("raceName", "")
@@ -514,7 +1019,7 @@ class RaceScreen(ModalScreen[None]):
                 try:
                     date_obj = datetime.strptime(date, "%Y-%m-%d")
                     formatted_date = date_obj.strftime("%b %d, %Y")
-                except:
+                except ValueError:
                     formatted_date = date
             
             # Get race results and status
@@ -529,7 +1034,7 @@ class RaceScreen(ModalScreen[None]):
                 # Race has been completed with results
                 winner = results[0]  # First position is winner
                 driver = winner.get("Driver", {})
-                winner_name = f"{driver.get('givenName', '')} {driver.get('familyName', '')}".strip()
+                winner_name = _full_name(driver)
                 winner_team = winner.get("Constructor", {}).get("name", "")
                 total_laps = str(winner.get("laps", ""))
                 
@@ -550,123 +1055,235 @@ class RaceScreen(ModalScreen[None]):
                 total_laps = "TBD"
                 race_time = "TBD"
             
-            rtab.add_row(
-                self._truncate(grand_prix, gp_w),
-                self._truncate(formatted_date, 12),
-                self._truncate(winner_name, winner_w),
-                self._truncate(winner_team, team_w),
-                self._truncate(total_laps, 5),
-                self._truncate(race_time, 12),
-            )
-
-    @staticmethod
-    def _truncate(text, width):
-        if width <= 0:
-            return ""
-        if len(text) <= width:
-            return text
-        return text[: max(0, width - 1)] + "…"
-
-
-def get_driver_last_results(driver_id: str, limit: int = 10):
-    """Fetch most recent race results for a driver (newest 10)."""
-    # Step 1: get total results
-    meta = fetch_with_cache(
-        f"/ergast/f1/drivers/{driver_id}/results.json?limit=1",
-        f"driver_last_meta_{driver_id}",
-        expire_minutes=1440,
+            race_rows.append((
+                _truncate(grand_prix, gp_w),
+                _truncate(formatted_date, 12),
+                _truncate(winner_name, winner_w),
+                _truncate(winner_team, team_w),
+                _truncate(total_laps, 5),
+                _truncate(race_time, 12),
+            ))
+
+        if widths != widths_shown:
+            # Race table: [0]=Grand Prix, [1]=Date, [2]=Winner, [3]=Team, [4]=Laps, [5]=Race Time
+            _resize_columns(rtab, (gp_w, 12, winner_w, team_w, 5, 12), race_rows)
+        else:
+            _sync_rows(rtab, race_rows, self._last_race_rows)
+        self._last_race_rows = race_rows
+
+
+def _ttl_cache(ttl_seconds):
+    """Memoize a function's return value per argument set for ttl_seconds.
+
+    Arguments are bound against the signature so f(x) and f(x, limit=10)
+    share an entry. The wrapper exposes cache_clear() to drop everything.
+    """
+    def decorator(func):
+        sig = inspect.signature(func)
+        entries = {}
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.values())
+            hit = entries.get(key)
+            now = time.monotonic()
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            value = func(*args, **kwargs)
+            entries[key] = (now + ttl_seconds, value)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(HISTORY_TTL_SECONDS)
+def get_driver_last_results(driver_id: str, limit: int = 10, order: str = "asc"):
+    """Fetch a driver's most recent race results this season (newest 10).
+
+    Races come oldest first; pass order="desc" for newest first.
+    """
+    # One request covers the whole season (<= 24 rounds), so no total/offset lookup is needed
+    year = get_current_year()
+    data = fetch_with_cache(
+        f"/ergast/f1/{year}/drivers/{driver_id}/results.json?limit=30",
+        f"driver_season_{year}_{driver_id}",
     )
-    total_str = meta.get("MRData", {}).get("total", "0")
-    try:
-        total = int(total_str)
-    except Exception:
-        total = 0
-    start = max(0, total - limit)
-    # Step 2: fetch the last window
-    endpoint = f"/ergast/f1/drivers/{driver_id}/results.json?limit={limit}&offset={start}"
-    data = fetch_with_cache(endpoint, f"driver_last_{driver_id}_{limit}_{start}", expire_minutes=1440)
-    return data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
-
-
-def get_constructor_last_results(constructor_id: str, limit: int = 10):
-    """Fetch most recent race results for a constructor (newest 10)."""
-    meta = fetch_with_cache(
-        f"/ergast/f1/constructors/{constructor_id}/results.json?limit=1",
-        f"constructor_last_meta_{constructor_id}",
-        expire_minutes=1440,
+    races = _path(data, "MRData", "RaceTable", "Races", default=[])[-limit:]
+    return races[::-1] if order == "desc" else races
+
+
+@_ttl_cache(HISTORY_TTL_SECONDS)
+def get_constructor_last_results(constructor_id: str, limit: int = 10, order: str = "asc"):
+    """Fetch a constructor's most recent race results this season (newest 10).
+
+    Races come oldest first; pass order="desc" for newest first.
+    """
+    # Two result rows per round count against the API limit, hence the larger page
+    year = get_current_year()
+    data = fetch_with_cache(
+        f"/ergast/f1/{year}/constructors/{constructor_id}/results.json?limit=100",
+        f"constructor_season_{year}_{constructor_id}",
     )
-    total_str = meta.get("MRData", {}).get("total", "0")
+    races = _path(data, "MRData", "RaceTable", "Races", default=[])[-limit:]
+    return races[::-1] if order == "desc" else races
+
+
+def _results_ttl(race_date, today):
+    """Cache TTL in minutes for a completed round's results, by how long ago it ran."""
+    age = today - race_date
+    if age > timedelta(days=7):
+        return PAST_RESULTS_TTL
+    if age <= timedelta(days=2):
+        return RECENT_RESULTS_TTL
+    return RESULTS_TTL
+
+
+def _fetch_round_results(season, round_num, expire_minutes=RESULTS_TTL, force=False):
+    """Return the Results list for one round, or [] if none are available."""
     try:
-        total = int(total_str)
+        individual_race_data = fetch_with_cache(
+            f"/ergast/f1/{season}/{round_num}/results.json",
+            f"race_results_{season}_{round_num}",
+            expire_minutes=expire_minutes,
+            force=force
+        )
     except Exception:
-        total = 0
-    start = max(0, total - limit)
-    endpoint = f"/ergast/f1/constructors/{constructor_id}/results.json?limit={limit}&offset={start}"
-    data = fetch_with_cache(endpoint, f"constructor_last_{constructor_id}_{limit}_{start}", expire_minutes=1440)
-    return data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+        # Error fetching results, treat as no results available
+        return []
+    individual_races = _path(individual_race_data, "MRData", "RaceTable", "Races", default=[])
+    if individual_races and individual_races[0].get("Results"):
+        return individual_races[0]["Results"]
+    return []
+
+
+def _page_rows(data):
+    """Number of result rows in one page of the season-wide results feed."""
+    races = _path(data, "MRData", "RaceTable", "Races", default=[])
+    return sum(len(race.get("Results", [])) for race in races)
+
+
+def _page_rounds(data):
+    """Set of rounds with rows in one page of the season-wide results feed."""
+    races = _path(data, "MRData", "RaceTable", "Races", default=[])
+    return {race.get("round") for race in races}
+
+
+def _fetch_season_results(season, round_ttls, force=False):
+    """Return {round: Results} for every round in the season-wide results feed.
+
+    round_ttls maps each completed round to its cache TTL. A full page can't
+    gain rows, so it is cached for the shortest TTL of the rounds it holds;
+    the last, partial page takes the shortest TTL of the whole season.
+    """
+    season_ttl = min(round_ttls.values())
+
+    def page(offset):
+        key = f"season_results_{season}_{offset}"
+        # The cached copy tells us which rounds this page holds
+        cached = _path(_cache_get(key), "data")
+        ttl = season_ttl
+        if cached and _page_rows(cached) >= SEASON_RESULTS_PAGE:
+            ttl = min(
+                (round_ttls.get(race.get("round"), season_ttl)
+                 for race in _path(cached, "MRData", "RaceTable", "Races", default=[])),
+                default=season_ttl,
+            )
+        return fetch_with_cache(
+            f"/ergast/f1/{season}/results.json?limit={SEASON_RESULTS_PAGE}&offset={offset}",
+            key,
+            expire_minutes=ttl,
+            force=force
+        )
+
+    # The completed rounds can't fill more pages than this, whatever the API claims
+    max_pages = math.ceil(len(round_ttls) * SEASON_MAX_GRID / SEASON_RESULTS_PAGE)
+    max_rows = max_pages * SEASON_RESULTS_PAGE
+
+    # The first page reports the row total; the remaining pages can then go out together
+    first = page(0)
+    total = min(int(_path(first, "MRData", "total") or 0), max_rows)
+    pages = [first]
+    pages.extend(_POOL.map(page, range(SEASON_RESULTS_PAGE, total, SEASON_RESULTS_PAGE)))
+    # A long-cached first page can report a stale total; carry on while pages come
+    # back full, stopping at the bound or at a page that brings no new rounds
+    seen = set().union(*map(_page_rounds, pages))
+    offset = len(pages) * SEASON_RESULTS_PAGE
+    while offset < max_rows and _page_rows(pages[-1]) >= SEASON_RESULTS_PAGE:
+        data = page(offset)
+        rounds = _page_rounds(data)
+        if rounds <= seen:
+            break
+        seen |= rounds
+        pages.append(data)
+        offset += SEASON_RESULTS_PAGE
+
+    by_round = {}
+    for data in pages:
+        for race in _path(data, "MRData", "RaceTable", "Races", default=[]):
+            # A race's results can straddle a page boundary, so merge by round
+            by_round.setdefault(race.get("round"), []).extend(race.get("Results", []))
+    return by_round
 
 
 def get_all_races_season(season, force=False):
-    """Get all races for a season, fetching individual race results for accurate data."""
+    """Get all races for a season with the results of every completed round attached."""
     from datetime import datetime, date
     
     # First get all scheduled races
-    schedule_data = fetch_with_cache(
-        f"/ergast/f1/{season}.json?limit=100",
-        f"race_schedule_{season}",
-        expire_minutes=1440,
-        force=force
-    )
-    scheduled_races = schedule_data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
+    scheduled_races = get_race_schedule(season, force=force)
     
     # Get today's date for comparison
     today = date.today()
     
-    # For each race, fetch individual results if race should be completed
-    all_races = []
+    # Parse race dates; races on or before today should have results
+    race_dates = []
     for race in scheduled_races:
-        round_num = race.get("round")
-        race_date_str = race.get("date", "")
-        
-        # Parse race date
         race_date = None
+        race_date_str = race.get("date", "")
         if race_date_str:
             try:
                 race_date = datetime.strptime(race_date_str, "%Y-%m-%d").date()
-            except:
+            except ValueError:
                 pass
-        
+        race_dates.append(race_date)
+    completed = [
+        (race.get("round"), _results_ttl(race_date, today))
+        for race, race_date in zip(scheduled_races, race_dates)
+        if race_date and race_date <= today
+    ]
+    
+    # One paged season-wide query covers every completed round; each page is
+    # cached according to the rounds it holds
+    round_results = {}
+    if completed:
+        try:
+            round_results = _fetch_season_results(season, dict(completed), force)
+        except Exception:
+            # Fall back to the per-round endpoint below
+            pass
+    
+    # Rounds the batch didn't cover are fetched individually and concurrently
+    missing = [item for item in completed if not round_results.get(item[0])]
+    round_results.update(zip(
+        [round_num for round_num, _ in missing],
+        _POOL.map(lambda item: _fetch_round_results(season, item[0], item[1], force), missing),
+    ))
+    
+    all_races = []
+    for race, race_date in zip(scheduled_races, race_dates):
         race_copy = race.copy()
-        
-        # Check if race should be completed and fetch individual results
         if race_date and race_date <= today:
-            # Try to fetch individual race results
-            try:
-                individual_race_data = fetch_with_cache(
-                    f"/ergast/f1/{season}/{round_num}/results.json",
-                    f"race_results_{season}_{round_num}",
-                    expire_minutes=60,  # Shorter cache for results
-                    force=force
-                )
-                individual_races = individual_race_data.get("MRData", {}).get("RaceTable", {}).get("Races", [])
-                
-                if individual_races and individual_races[0].get("Results"):
-                    # Race has results available
-                    race_copy["Results"] = individual_races[0]["Results"]
-                    race_copy["Status"] = "completed"
-                else:
-                    # Race should be completed but no results available
-                    race_copy["Results"] = []
-                    race_copy["Status"] = "completed_no_results"
-            except Exception:
-                # Error fetching results, treat as no results available
-                race_copy["Results"] = []
-                race_copy["Status"] = "completed_no_results"
+            race_copy["Results"] = round_results.get(race.get("round"), [])
+            # Completed without results means the API hasn't published them
+            race_copy["Status"] = "completed" if race_copy["Results"] else "completed_no_results"
         else:
             # Future race
             race_copy["Results"] = []
             race_copy["Status"] = "scheduled"
-        
         all_races.append(race_copy)
     
     return all_races
@@ -695,8 +1312,6 @@ class RaceDetailScreen(ModalScreen[None]):
         super().__init__()
         self.race = race_data
         self.table: DataTable | None = None
-        self._spinner_idx = 0
-        self._spinner_timer = None
 
     def compose(self) -> ComposeResult:
         race_name = self.race.get("raceName", "Race")
@@ -716,7 +1331,10 @@ class RaceDetailScreen(ModalScreen[None]):
         header = Static(title, id="detail-title")
         table = DataTable(id="detail-table")
         self.table = table
-        table.add_columns("Pos", "Driver", "Team", "Grid", "Time/Status", "Pts")
+        for label, width in (
+            ("Pos", 3), ("Driver", 20), ("Team", 15), ("Grid", 4), ("Time/Status", 15), ("Pts", 4),
+        ):
+            table.add_column(label, width=width)
         yield Vertical(header, table, id="detail-wrapper")
 
     def on_mount(self) -> None:
@@ -726,7 +1344,7 @@ class RaceDetailScreen(ModalScreen[None]):
             for result in race_results:
                 pos = str(result.get("position", ""))
                 driver = result.get("Driver", {})
-                name = f"{driver.get('givenName', '')} {driver.get('familyName', '')}".strip()
+                name = _full_name(driver)
                 team = result.get("Constructor", {}).get("name", "")
                 grid = str(result.get("grid", ""))
                 
@@ -739,17 +1357,6 @@ class RaceDetailScreen(ModalScreen[None]):
                 
                 pts = str(result.get("points", ""))
                 self.table.add_row(pos, name, team, grid, time_str, pts)
-            
-            try:
-                # Set column widths for race results
-                self.table.set_column_width(0, 3)   # Pos
-                self.table.set_column_width(1, 20)  # Driver
-                self.table.set_column_width(2, 15)  # Team
-                self.table.set_column_width(3, 4)   # Grid
-                self.table.set_column_width(4, 15)  # Time/Status
-                self.table.set_column_width(5, 4)   # Pts
-            except Exception:
-                pass
 
     def on_key(self, event):  # close on ESC/Enter
         if getattr(event, "key", None) in ("escape", "enter"):
@@ -761,178 +1368,139 @@ class RaceDetailScreen(ModalScreen[None]):
                 pass
 
 
-class DriverDetailScreen(ModalScreen[None]):
-    def __init__(self, driver_standing: dict):
+class RowsReady(Message):
+    """Posted by a detail screen's loader once its table rows are built."""
+
+    def __init__(self, rows: list) -> None:
+        super().__init__()
+        self.rows = rows
+
+
+class _DetailScreenBase(ModalScreen[None]):
+    """Modal with a title and a table of recent results, loaded in the background.
+
+    Subclasses set COLUMNS/COL_WIDTHS and pass the title, a blocking fetch()
+    returning races newest first, and a to_row(race) giving one race's cells
+    (or None to skip it).
+    """
+    COLUMNS: tuple = ()
+    # (column index, width) pairs; other columns size to their content
+    COL_WIDTHS: tuple = ()
+
+    def __init__(self, title: str, fetch, to_row):
         super().__init__()
-        self.driver = driver_standing
         self.table: DataTable | None = None
-        self._spinner_idx = 0
-        self._spinner_timer = None
+        self._base_title = title
+        self._fetch = fetch
+        self._to_row = to_row
+        self._loading: LoadingIndicator | None = None
+
+    def _build_rows(self) -> list:
+        """Fetch and shape every row as a tuple of strings, newest first."""
+        rows = []
+        for race in self._fetch():
+            row = self._to_row(race)
+            if row is not None:
+                rows.append(tuple(map(str, row)))
+        return rows
 
     def compose(self) -> ComposeResult:
-        drv = self.driver.get('Driver', {})
-        name = f"{drv.get('givenName','')} {drv.get('familyName','')}".strip()
-        code = drv.get('code', '')
-        team = self.driver.get("Constructors", [{}])[0].get("name", "") if self.driver.get("Constructors") else ""
-        title = f"Driver: {name}"
-        if code:
-            title += f" ({code})"
-        if team:
-            title += f" — {team}"
-        header = Static(title, id="detail-title")
+        header = Static(self._base_title, id="detail-title")
         table = DataTable(id="detail-table")
         self.table = table
-        table.add_columns("Rnd", "Grand Prix", "Grid", "Finish", "Status", "Pts")
-        yield Vertical(header, table, id="detail-wrapper")
+        widths = dict(self.COL_WIDTHS)
+        for i, label in enumerate(self.COLUMNS):
+            table.add_column(label, width=widths.get(i))
+        yield Vertical(header, LoadingIndicator(id="detail-loading"), table, id="detail-wrapper")
 
     def on_mount(self) -> None:
-        # Show loading state, then fetch in a background task
+        # The LoadingIndicator animates on its own until the rows arrive
         title = self.query_one("#detail-title", Static)
-        title.update(title.renderable + " — Loading…")
-
-        # Simple spinner animation on the title while loading
-        def spin():
-            frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            self._spinner_idx = (self._spinner_idx + 1) % len(frames)
-            try:
-                t = self.query_one("#detail-title", Static)
-                base = str(t.renderable).split(" — Loading…", 1)[0]
-                t.update(f"{base} — Loading… {frames[self._spinner_idx]}")
-            except Exception:
-                pass
-
-        self._spinner_timer = self.set_interval(0.1, spin)
+        self._loading = self.query_one("#detail-loading", LoadingIndicator)
 
         async def load():
             try:
-                driver_id = self.driver.get("Driver", {}).get("driverId", "")
-                races = get_driver_last_results(driver_id, limit=10)
-                rows = []
-                for r in reversed(races):
-                    round_no = r.get("round", "")
-                    gp = r.get("raceName", "")
-                    results = r.get("Results", [])
-                    result = results[0] if results else {}
-                    grid = result.get("grid", "")
-                    finish = result.get("positionText", result.get("position", ""))
-                    status = result.get("status", "")
-                    pts = result.get("points", "")
-                    rows.append((round_no, gp, grid, finish, status, pts))
-                if self.table:
-                    self.table.clear()
-                    for row in rows:
-                        self.table.add_row(*[str(x) for x in row])
-                    try:
-                        self.table.set_column_width(0, 4)
-                        self.table.set_column_width(2, 4)
-                        self.table.set_column_width(3, 6)
-                        self.table.set_column_width(5, 4)
-                    except Exception:
-                        pass
-                if self._spinner_timer:
-                    # Textual Timer doesn't have cancel(); use stop()
-                    try:
-                        self._spinner_timer.stop()
-                    except Exception:
-                        pass
-                title.update(str(title.renderable).split(" — Loading…", 1)[0])
+                # Fetch, shape and stringify off the event loop; the UI side only inserts
+                rows = await asyncio.to_thread(self._build_rows)
             except Exception as e:
-                if self._spinner_timer:
-                    try:
-                        self._spinner_timer.stop()
-                    except Exception:
-                        pass
-                title.update(f"{title.renderable} — Error: {e}")
+                title.update(f"{self._base_title} — Error: {e}")
+                self._loading.remove()
+            else:
+                self.post_message(RowsReady(rows))
 
         self.run_worker(load())
 
+    def on_rows_ready(self, message: RowsReady) -> None:
+        if self.table:
+            self.table.clear()
+            self.table.add_rows(message.rows)
+        self._loading.remove()
+
     def on_key(self, event):  # close on ESC/Enter
         if getattr(event, "key", None) in ("escape", "enter"):
             self.dismiss()
 
 
-class ConstructorDetailScreen(ModalScreen[None]):
-    def __init__(self, constructor_standing: dict):
-        super().__init__()
-        self.constructor = constructor_standing
-        self.table: DataTable | None = None
-        self._spinner_idx = 0
-        self._spinner_timer = None
+def _driver_result_row(race: dict) -> tuple:
+    # Bind the first result's .get once; every column reads from it
+    get = (race.get("Results") or ({},))[0].get
+    return (
+        race.get("round", ""),
+        race.get("raceName", ""),
+        get("grid", ""),
+        get("positionText") or get("position", ""),
+        get("status", ""),
+        get("points", ""),
+    )
 
-    def compose(self) -> ComposeResult:
-        name = self.constructor.get("Constructor", {}).get("name", "")
-        header = Static(f"Constructor: {name}", id="detail-title")
-        table = DataTable(id="detail-table")
-        self.table = table
-        table.add_columns("Rnd", "Grand Prix", "Car #", "Driver", "Finish", "Pts")
-        yield Vertical(header, table, id="detail-wrapper")
 
-    def on_mount(self) -> None:
-        # Show loading state, then fetch in a background task
-        title = self.query_one("#detail-title", Static)
-        title.update(title.renderable + " — Loading…")
+def _constructor_result_row(race: dict) -> tuple | None:
+    results = race.get("Results")
+    if not results:
+        return None
+    get = results[0].get
+    return (
+        race.get("round", ""),
+        race.get("raceName", ""),
+        get("number", ""),
+        _full_name(get("Driver") or {}),
+        get("positionText") or get("position", ""),
+        get("points", ""),
+    )
 
-        def spin():
-            frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-            self._spinner_idx = (self._spinner_idx + 1) % len(frames)
-            try:
-                t = self.query_one("#detail-title", Static)
-                base = str(t.renderable).split(" — Loading…", 1)[0]
-                t.update(f"{base} — Loading… {frames[self._spinner_idx]}")
-            except Exception:
-                pass
 
-        self._spinner_timer = self.set_interval(0.1, spin)
+class DriverDetailScreen(_DetailScreenBase):
+    COLUMNS = ("Rnd", "Grand Prix", "Grid", "Finish", "Status", "Pts")
+    COL_WIDTHS = _DRIVER_COL_WIDTHS
 
-        async def load():
-            try:
-                const_id = self.constructor.get("Constructor", {}).get("constructorId", "")
-                races = get_constructor_last_results(const_id, limit=10)
-                rows = []
-                for r in reversed(races):
-                    round_no = r.get("round", "")
-                    gp = r.get("raceName", "")
-                    results = r.get("Results", [])
-                    if results:
-                        result = results[0]
-                        car_no = result.get("number", "")
-                        drv = result.get("Driver", {})
-                        drv_name = f"{drv.get('givenName','')} {drv.get('familyName','')}".strip()
-                        finish = result.get("positionText", result.get("position", ""))
-                        pts = result.get("points", "")
-                        rows.append((round_no, gp, car_no, drv_name, finish, pts))
-                if self.table:
-                    self.table.clear()
-                    for row in rows:
-                        self.table.add_row(*[str(x) for x in row])
-                    try:
-                        self.table.set_column_width(0, 4)
-                        self.table.set_column_width(2, 6)
-                        self.table.set_column_width(4, 6)
-                        self.table.set_column_width(5, 4)
-                    except Exception:
-                        pass
-                if self._spinner_timer:
-                    # Textual Timer doesn't have cancel(); use stop()
-                    try:
-                        self._spinner_timer.stop()
-                    except Exception:
-                        pass
-                title.update(str(title.renderable).split(" — Loading…", 1)[0])
-            except Exception as e:
-                if self._spinner_timer:
-                    try:
-                        self._spinner_timer.stop()
-                    except Exception:
-                        pass
-                title.update(f"{title.renderable} — Error: {e}")
+    def __init__(self, driver_standing: dict):
+        drv = driver_standing.get('Driver', {})
+        team = driver_standing.get("Constructors", [{}])[0].get("name", "") if driver_standing.get("Constructors") else ""
+        title = f"Driver: {_full_name(drv)}"
+        if drv.get('code'):
+            title += f" ({drv['code']})"
+        if team:
+            title += f" — {team}"
+        super().__init__(
+            title,
+            partial(get_driver_last_results, drv.get("driverId", ""), limit=10, order="desc"),
+            _driver_result_row,
+        )
+        self.driver = driver_standing
 
-        self.run_worker(load())
-    # end on_mount
 
-    def on_key(self, event):
-        if getattr(event, "key", None) in ("escape", "enter"):
-            self.dismiss()
+class ConstructorDetailScreen(_DetailScreenBase):
+    COLUMNS = ("Rnd", "Grand Prix", "Car #", "Driver", "Finish", "Pts")
+    COL_WIDTHS = _CONSTRUCTOR_COL_WIDTHS
+
+    def __init__(self, constructor_standing: dict):
+        const = constructor_standing.get("Constructor", {})
+        super().__init__(
+            f"Constructor: {const.get('name', '')}",
+            partial(get_constructor_last_results, const.get("constructorId", ""), limit=10, order="desc"),
+            _constructor_result_row,
+        )
+        self.constructor = constructor_standing
 
 
 if __name__ == "__main__":
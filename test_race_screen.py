@@ -1,44 +1,100 @@
 #!/usr/bin/env python3
 
 # Quick test script to verify race screen functionality
-import sys
-sys.path.append('.')
+# Set F1_OFFLINE=1 to use the recorded season in fixtures/ instead of the API
+import json
+import os
 
-from f1_dashboard import get_all_races_season
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def _load_fixture_races(season, force=False):
+    with open(os.path.join(FIXTURES, f"races_{season}.json")) as f:
+        return json.load(f)
 
 def test_race_screen():
-    print("Testing race screen functionality...")
-    
-    try:
-        # Test the race data loading
-        races = get_all_races_season(2025)
-        print(f"✅ Loaded {len(races)} races successfully")
-        
-        # Test race categorization
-        completed = [r for r in races if r.get('Status') == 'completed']
-        completed_no_results = [r for r in races if r.get('Status') == 'completed_no_results']
-        scheduled = [r for r in races if r.get('Status') == 'scheduled']
-        
-        print(f"✅ Completed races: {len(completed)}")
-        print(f"✅ Completed no results: {len(completed_no_results)}")
-        print(f"✅ Scheduled races: {len(scheduled)}")
-        
-        # Test a completed race
-        if completed:
-            race = completed[0]
-            race_name = race.get('raceName', '')
-            results = race.get('Results', [])
-            winner = results[0] if results else {}
-            driver = winner.get('Driver', {})
-            winner_name = f"{driver.get('givenName', '')} {driver.get('familyName', '')}".strip()
-            print(f"✅ Sample race: {race_name} - Winner: {winner_name}")
-        
-        print("\n🎉 All race screen functionality tests passed!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error testing race screen: {e}")
-        return False
+    if os.environ.get("F1_OFFLINE"):
+        load_races = _load_fixture_races
+    else:
+        from f1_dashboard import get_all_races_season as load_races
+
+    # Test the race data loading
+    races = load_races(2025)
+    assert races
+
+    # Test race categorization (single pass; unknown statuses are dropped)
+    buckets = {'completed': [], 'completed_no_results': [], 'scheduled': []}
+    for r in races:
+        buckets.get(r.get('Status'), []).append(r)
+    completed, completed_no_results, scheduled = buckets.values()
+    assert completed or completed_no_results or scheduled
+
+    # Test a completed race
+    if completed:
+        race = completed[0]
+        assert race.get('raceName')
+        winner = race['Results'][0]
+        assert winner.get('Driver', {}).get('familyName')
+
+def _results_page(rows, offset, limit, total):
+    # rows are (round, driver) pairs in API order; slice them into one page
+    races = []
+    for round_no, driver in rows[offset:offset + limit]:
+        if not races or races[-1]["round"] != round_no:
+            races.append({"round": round_no, "Results": []})
+        races[-1]["Results"].append({"Driver": {"driverId": driver}})
+    return {"MRData": {"total": str(total), "RaceTable": {"Races": races}}}
+
+def test_season_results_merge_across_pages(monkeypatch):
+    import f1_dashboard
+
+    # Round 2's results straddle the first page boundary
+    rows = [("1", "a"), ("1", "b"), ("1", "c"),
+            ("2", "a"), ("2", "b"), ("2", "c"),
+            ("3", "a"), ("3", "b")]
+    pages = {}
+
+    def fake_fetch(endpoint, key, expire_minutes=None, force=False):
+        offset = int(key.rsplit("_", 1)[1])
+        pages[offset] = expire_minutes
+        return _results_page(rows, offset, 4, len(rows))
+
+    cached_first = _results_page(rows, 0, 4, len(rows))
+    monkeypatch.setattr(f1_dashboard, "SEASON_RESULTS_PAGE", 4)
+    monkeypatch.setattr(f1_dashboard, "fetch_with_cache", fake_fetch)
+    monkeypatch.setattr(
+        f1_dashboard, "_cache_get",
+        lambda key: {"data": cached_first} if key.endswith("_0") else None,
+    )
+
+    by_round = f1_dashboard._fetch_season_results(2025, {"1": 1000, "2": 500, "3": 15})
+
+    assert {r: [x["Driver"]["driverId"] for x in res] for r, res in by_round.items()} == {
+        "1": ["a", "b", "c"],
+        "2": ["a", "b", "c"],
+        "3": ["a", "b"],
+    }
+    # The full cached page holds rounds 1-2 only; the rest take the season minimum
+    assert pages == {0: 500, 4: 15, 8: 15}
+
+def test_season_results_paging_is_bounded(monkeypatch):
+    import f1_dashboard
+
+    # A misbehaving proxy that returns the same full page for every offset
+    rows = [("1", "a"), ("1", "b"), ("2", "a"), ("2", "b")]
+    offsets = []
+
+    def fake_fetch(endpoint, key, expire_minutes=None, force=False):
+        offsets.append(int(key.rsplit("_", 1)[1]))
+        return _results_page(rows, 0, 4, 4)
+
+    monkeypatch.setattr(f1_dashboard, "SEASON_RESULTS_PAGE", 4)
+    monkeypatch.setattr(f1_dashboard, "fetch_with_cache", fake_fetch)
+    monkeypatch.setattr(f1_dashboard, "_cache_get", lambda key: None)
+
+    by_round = f1_dashboard._fetch_season_results(2025, {"1": 15, "2": 15})
+
+    assert sorted(by_round) == ["1", "2"]
+    assert offsets == [0, 4]
 
 if __name__ == "__main__":
     test_race_screen()